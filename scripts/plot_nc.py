@@ -5,17 +5,28 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from netCDF4 import Dataset
 
 
+def _edges(centers: np.ndarray) -> np.ndarray:
+    """Cell boundaries (length N+1) from 1D cell centers (length N)."""
+    centers = np.asarray(centers, dtype=float)
+    midpoints = (centers[:-1] + centers[1:]) / 2
+    first = centers[0] - (centers[1] - centers[0]) / 2
+    last = centers[-1] + (centers[-1] - centers[-2]) / 2
+    return np.concatenate(([first], midpoints, [last]))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Plot FLEXPART NetCDF output")
     parser.add_argument("nc_file", type=Path, help="Path to grid_conc_*.nc file")
     parser.add_argument(
         "--output", type=Path, default=None, help="Path to save PNG (defaults next to file)"
     )
+    parser.add_argument("--dpi", type=int, default=100, help="Output resolution")
     args = parser.parse_args()
 
     nc_path = args.nc_file.expanduser()
@@ -28,18 +39,46 @@ def main() -> None:
         conc = ds.variables.get("spec001_mr")
         title = f"{nc_path.name}"
         if conc is not None and conc.shape[2] > 0:
-            data = conc[0, 0, 0, 0, :, :]
+            # Plain ndarray reads: disabling auto-masking skips the
+            # MaskedArray wrapper around the hyperslab we actually need.
+            conc.set_auto_mask(False)
+            data = np.asarray(conc[0, 0, 0, 0, :, :])
             label = "spec001_mr (first time, height)"
         else:
             if "ORO" not in ds.variables:
                 raise SystemExit("No concentration field or ORO variable available to plot")
-            data = ds.variables["ORO"][:]
+            oro = ds.variables["ORO"]
+            oro.set_auto_mask(False)
+            data = np.asarray(oro[:])
             label = "ORO (m)"
             title += " – no conc data; showing ORO"
 
-    lon2d, lat2d = np.meshgrid(lon, lat)
-    fig, ax = plt.subplots(figsize=(8, 6))
-    mesh = ax.pcolormesh(lon2d, lat2d, data, shading="auto")
+    # OO API: no pyplot figure manager, no GUI backend, no atexit handler.
+    fig = Figure(figsize=(8, 6))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    dx = lon[1] - lon[0]
+    dy = lat[1] - lat[0]
+    if np.allclose(np.diff(lon), dx) and np.allclose(np.diff(lat), dy):
+        # Uniform grid: imshow avoids the per-quad tessellation (and the
+        # meshgrid coordinate arrays) that pcolormesh would build.
+        extent = (
+            float(lon[0]) - dx / 2,
+            float(lon[-1]) + dx / 2,
+            float(lat[0]) - dy / 2,
+            float(lat[-1]) + dy / 2,
+        )
+        mesh = ax.imshow(
+            np.asarray(data),
+            extent=extent,
+            origin="lower",
+            interpolation="nearest",
+            aspect="auto",
+        )
+    else:
+        # pcolorfast picks the fastest image artist for the grid layout, but
+        # for irregular grids it needs cell edges (length N+1), not centers.
+        mesh = ax.pcolorfast(_edges(lon), _edges(lat), data)
     cbar = fig.colorbar(mesh, ax=ax, label=label)
     ax.set_xlabel("Longitude")
     ax.set_ylabel("Latitude")
@@ -47,8 +86,7 @@ def main() -> None:
     ax.set_aspect('auto')
 
     out_path = args.output or nc_path.with_suffix(".png")
-    fig.tight_layout()
-    fig.savefig(out_path, dpi=200)
+    canvas.print_figure(out_path, dpi=args.dpi, bbox_inches="tight")
     print(f"Saved plot to {out_path}")
 
 
@@ -51,6 +51,13 @@ def run(
 ) -> None:
     """Run a single FLEXPART simulation end-to-end."""
 
+    if end <= start:
+        raise typer.BadParameter("end must be after start")
+    if release_top < release_bottom:
+        raise typer.BadParameter("release-top must be greater or equal to release-bottom")
+    if not species.isascii():
+        raise typer.BadParameter("species name must be ASCII (it is written into a namelist)")
+
     workspace = workspace.expanduser().resolve()
     window = TimeWindow(start=start, end=end)
     release = ReleaseGeometry(
@@ -75,7 +82,10 @@ def run(
     runtime = RuntimeConfig(
         simulation=simulation_cfg,
         paths=PathsConfig(workspace=workspace),
-        credentials=CredPaths(cdsapi_path=cdsapirc, ecmwfapi_path=ecmwfapirc),
+        credentials=CredPaths(
+            cdsapi_path=cdsapirc.expanduser() if cdsapirc else None,
+            ecmwfapi_path=ecmwfapirc.expanduser() if ecmwfapirc else None,
+        ),
         flexpart_image=flexpart_image,
         flex_extract_image=flex_extract_image,
         docker_timeout_sec=docker_timeout,
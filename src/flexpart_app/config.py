@@ -1,128 +1,122 @@
 """Typed configuration objects for FLEXPART application workflows."""
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, PositiveFloat, PositiveInt, field_validator, model_validator
 
-
-class TimeWindow(BaseModel):
+@dataclass(slots=True)
+class TimeWindow:
     """Simulation start/end timestamps with validation."""
 
-    start: datetime = Field(..., description="Simulation start timestamp (UTC)")
-    end: datetime = Field(..., description="Simulation end timestamp (UTC)")
+    start: datetime
+    end: datetime
 
-    @model_validator(mode="after")
-    def _check_order(self) -> "TimeWindow":
+    def __post_init__(self) -> None:
         if self.end <= self.start:
             msg = "end must be after start"
             raise ValueError(msg)
-        return self
 
 
-class ReleaseGeometry(BaseModel):
+@dataclass(slots=True)
+class ReleaseGeometry:
     """Spatial description of the source term."""
 
-    latitude: float = Field(..., ge=-90.0, le=90.0)
-    longitude: float = Field(..., ge=-180.0, le=180.0)
-    height_bottom_m: float = Field(0.0, ge=0.0)
-    height_top_m: float = Field(100.0, ge=0.0)
-    duration_hours: PositiveFloat = Field(6.0)
+    latitude: float
+    longitude: float
+    height_bottom_m: float = 0.0
+    height_top_m: float = 100.0
+    duration_hours: float = 6.0
 
-    @model_validator(mode="after")
-    def _check_heights(self) -> "ReleaseGeometry":
+    def __post_init__(self) -> None:
         if self.height_top_m < self.height_bottom_m:
             msg = "height_top_m must be greater or equal to height_bottom_m"
             raise ValueError(msg)
-        return self
 
 
-class SpeciesDefinition(BaseModel):
+@dataclass(slots=True)
+class SpeciesDefinition:
     """FLEXPART species slot parameters."""
 
-    name: str = Field(..., min_length=1)
-    molecular_weight: PositiveFloat = Field(28.0)
-    half_life_days: Optional[PositiveFloat] = Field(
-        None, description="Optional radioactive decay half-life in days"
-    )
+    name: str
+    molecular_weight: float = 28.0
+    half_life_days: Optional[float] = None
 
 
-class SimulationNumerics(BaseModel):
+@dataclass(slots=True)
+class SimulationNumerics:
     """Numerical controls for FLEXPART."""
 
-    particles: PositiveInt = Field(20_000, description="Number of computational particles")
-    output_interval_sec: PositiveInt = Field(3600)
-    sampling_interval_sec: PositiveInt = Field(900)
-    turbulence: Literal[0, 1] = Field(1)
-    netcdf_output: Literal[0, 1] = Field(1)
-
+    particles: int = 20_000
+    output_interval_sec: int = 3600
+    sampling_interval_sec: int = 900
+    turbulence: Literal[0, 1] = 1
+    netcdf_output: Literal[0, 1] = 1
 
-class CredPaths(BaseModel):
-    """Credential locations for flex_extract."""
 
-    cdsapi_path: Optional[Path] = Field(
-        default=None,
-        description="Path to .cdsapirc file (will be mounted read-only)",
-    )
-    ecmwfapi_path: Optional[Path] = Field(
-        default=None,
-        description="Optional .ecmwfapirc path for member-only datasets",
-    )
+@dataclass(slots=True)
+class CredPaths:
+    """Credential locations for flex_extract (mounted read-only)."""
 
-    @field_validator("cdsapi_path", "ecmwfapi_path")
-    @classmethod
-    def _expand_path(cls, value: Optional[Path]) -> Optional[Path]:
-        return value.expanduser() if value else value
+    cdsapi_path: Optional[Path] = None
+    ecmwfapi_path: Optional[Path] = None
 
 
-class PathsConfig(BaseModel):
+# No slots here: cached_property needs the instance __dict__.
+@dataclass
+class PathsConfig:
     """Filesystem layout for a simulation run."""
 
-    workspace: Path = Field(..., description="Root work directory")
+    workspace: Path
 
-    @property
+    @cached_property
     def meteo_dir(self) -> Path:
         return self.workspace / "meteo"
 
-    @property
+    @cached_property
     def meteo_preprocessed_dir(self) -> Path:
         return self.meteo_dir / "preprocessed"
 
-    @property
+    @cached_property
     def flex_extract_workspace(self) -> Path:
         return self.meteo_dir / "flex_extract_workspace"
 
-    @property
+    @cached_property
     def output_dir(self) -> Path:
         return self.workspace / "output"
 
-    @property
+    @cached_property
     def species_dir(self) -> Path:
         return self.workspace / "SPECIES"
 
 
-class SimulationConfig(BaseModel):
+@dataclass(slots=True)
+class SimulationConfig:
     """Full set of knobs for orchestrating a FLEXPART run."""
 
     window: TimeWindow
     release: ReleaseGeometry
     species: SpeciesDefinition
-    numerics: SimulationNumerics = Field(default_factory=SimulationNumerics)
-    release_mass_kg: PositiveFloat = Field(1.0)
+    numerics: SimulationNumerics = field(default_factory=SimulationNumerics)
+    release_mass_kg: float = 1.0
     use_era5: bool = True
-    grid_deg: float = Field(0.5, gt=0.0, le=1.0, description="ERA5 target grid spacing")
+    grid_deg: float = 0.5
+    # Days per flex_extract MARS request; None autosizes from the window.
+    date_chunk: Optional[int] = None
 
 
-class RuntimeConfig(BaseModel):
+@dataclass(slots=True)
+class RuntimeConfig:
     """Combined configuration and environment options."""
 
     simulation: SimulationConfig
     paths: PathsConfig
     credentials: CredPaths
-    flexpart_image: str = Field("flexpart-v10.4-arm64:latest")
-    flex_extract_image: str = Field("convert2:latest")
-    docker_timeout_sec: int = Field(3600, gt=0)
-    log_level: Literal["INFO", "DEBUG"] = Field("INFO")
-
+    flexpart_image: str = "flexpart-v10.4-arm64:latest"
+    flex_extract_image: str = "convert2:latest"
+    docker_timeout_sec: int = 3600
+    assume_images_present: bool = False
+    log_level: Literal["INFO", "DEBUG"] = "INFO"
@@ -1,7 +1,10 @@
 """Utility helpers for invoking Docker with consistent logging and errors."""
 from __future__ import annotations
 
+import logging
 import subprocess
+import threading
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Sequence
@@ -9,6 +12,7 @@ from typing import Iterable, Sequence
 from rich.console import Console
 
 console = Console()
+log = logging.getLogger(__name__)
 
 
 class DockerError(RuntimeError):
@@ -64,18 +68,51 @@ class DockerRunner:
         return self._run(command)
 
     def _run(self, command: Sequence[str]) -> subprocess.CompletedProcess[str]:
-        console.log(f"[bold]$ {' '.join(command)}")
-        result = subprocess.run(
+        # Rich rendering (markup, styles, ANSI) is wasted work when output is
+        # redirected; fall back to plain stdlib logging off a terminal.
+        interactive = console.is_terminal
+        if interactive:
+            console.log(f"[bold]$ {' '.join(command)}")
+        else:
+            log.info("$ %s", " ".join(command))
+        # Stream container output line by line instead of buffering it all:
+        # long FLEXPART/flex_extract runs can emit a lot of log text, and
+        # progress should be visible as it happens. Only a bounded tail is
+        # retained for error reporting.
+        proc = subprocess.Popen(
             command,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=self.timeout_sec,
-            check=False,
+            bufsize=1,
         )
-        if result.returncode != 0:
-            snippet = result.stderr or result.stdout
-            raise DockerError(snippet.strip())
-        if result.stdout:
-            console.log(result.stdout.strip())
-        return result
+        tail: deque[str] = deque(maxlen=200)
+        assert proc.stdout is not None
+
+        def _drain() -> None:
+            for line in proc.stdout:
+                line = line.rstrip()
+                if not line:
+                    continue
+                if interactive:
+                    console.log(line)
+                elif log.isEnabledFor(logging.INFO):
+                    log.info("%s", line)
+                tail.append(line)
+
+        # Drain in a helper thread so the deadline is enforced on wait();
+        # blocking this thread on the pipe would make the timeout dead code.
+        reader = threading.Thread(target=_drain, daemon=True)
+        reader.start()
+        try:
+            returncode = proc.wait(timeout=self.timeout_sec)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        reader.join()
+        output = "\n".join(tail)
+        if returncode != 0:
+            raise DockerError(output.strip())
+        return subprocess.CompletedProcess(list(command), returncode, stdout=output, stderr="")
 
@@ -1,6 +1,9 @@
 """flex_extract container orchestration."""
 from __future__ import annotations
 
+import math
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -22,7 +25,7 @@ class FlexExtractService:
     def run(self, cfg: RuntimeConfig) -> Path:
         if not cfg.simulation.use_era5:
             raise ValueError("FlexExtractService should only run when use_era5=True")
-        if not self._docker.images(cfg.flex_extract_image):
+        if not cfg.assume_images_present and not self._docker.images(cfg.flex_extract_image):
             raise DockerError(
                 f"Docker image {cfg.flex_extract_image} missing. Build Dockerfile.convert2 first."
             )
@@ -41,13 +44,15 @@ class FlexExtractService:
         ] + credential_volumes
 
         release = cfg.simulation.release
-        margin = 10.0
-        north = min(90.0, release.latitude + margin)
-        south = max(-90.0, release.latitude - margin)
-        east = min(180.0, release.longitude + margin)
-        west = max(-180.0, release.longitude - margin)
+        north, west, south, east = self._bbox(
+            release.latitude, release.longitude, 10.0, cfg.simulation.grid_deg
+        )
 
         window = cfg.simulation.window
+        # Larger date chunks amortize MARS request setup over long windows;
+        # operators with a known quota profile can pin the value instead.
+        window_days = (window.end - window.start).days + 1
+        date_chunk = cfg.simulation.date_chunk or max(3, min(30, window_days // 4))
         args = [
             cfg.flex_extract_image,
             f"--start-date={window.start.strftime('%Y%m%d')}",
@@ -62,14 +67,15 @@ class FlexExtractService:
             "--output-dir=/workspace/output",
             "--request=0",
             "--rrint=1",
-            "--date-chunk=3",
+            f"--date-chunk={date_chunk}",
         ]
 
         console.log("Running flex_extract container...")
         self._docker.run(args, volumes=volumes, env=credential_env)
 
-        produced = list(output_dir.glob("EC*"))
-        if not produced:
+        with os.scandir(output_dir) as it:
+            has_ec = any(e.name.startswith("EC") for e in it)
+        if not has_ec:
             raise RuntimeError(
                 f"flex_extract completed but produced no EC files in {output_dir}"
             )
@@ -80,6 +86,23 @@ class FlexExtractService:
         console.log(f"Generated AVAILABLE with {count} entries")
         return output_dir
 
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _bbox(
+        lat: float, lon: float, margin: float, grid: float
+    ) -> tuple[float, float, float, float]:
+        """Grid-snapped (north, west, south, east) request area.
+
+        Snapping outward to the ERA5 grid keeps repeated requests on the
+        same MARS cache lines; memoization helps parameter sweeps that
+        reuse a release coordinate.
+        """
+        north = min(90.0, math.ceil((lat + margin) / grid) * grid)
+        south = max(-90.0, math.floor((lat - margin) / grid) * grid)
+        east = min(180.0, math.ceil((lon + margin) / grid) * grid)
+        west = max(-180.0, math.floor((lon - margin) / grid) * grid)
+        return north, west, south, east
+
     def _credential_env(
         self, cfg: RuntimeConfig
     ) -> tuple[list[tuple[Path, str, str]], list[tuple[str, str]]]:
@@ -1,7 +1,10 @@
 """Write FLEXPART input/control files for a simulation."""
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 
@@ -11,87 +14,29 @@ from ..config import RuntimeConfig
 
 console = Console()
 
-
-class FlexpartInputBuilder:
-    """Generates COMMAND/RELEASES/etc. based on the runtime config."""
-
-    STATIC_FILES = ("IGBP_int1.dat", "sfcdata.t", "sfcdepo.t")
-
-    def prepare(self, cfg: RuntimeConfig) -> None:
-        workspace = cfg.paths.workspace
-        workspace.mkdir(parents=True, exist_ok=True)
-        cfg.paths.output_dir.mkdir(parents=True, exist_ok=True)
-        cfg.paths.species_dir.mkdir(parents=True, exist_ok=True)
-        self._extract_static_files(cfg)
-        self._write_pathnames(cfg)
-        self._write_command(cfg)
-        self._write_releases(cfg)
-        self._write_species(cfg)
-        self._write_outgrid(cfg)
-        self._write_ageclasses(cfg)
-
-    def _extract_static_files(self, cfg: RuntimeConfig) -> None:
-        for fname in self.STATIC_FILES:
-            target = cfg.paths.workspace / fname
-            command = [
-                "docker",
-                "run",
-                "--rm",
-                "--entrypoint",
-                "/bin/cat",
-                cfg.flexpart_image,
-                f"/options/{fname}",
-            ]
-            console.log(f"Extracting {fname} from {cfg.flexpart_image}")
-            with open(target, "wb") as handle:
-                subprocess.run(command, check=True, stdout=handle)
-
-    def _write_pathnames(self, cfg: RuntimeConfig) -> None:
-        if cfg.simulation.use_era5:
-            preprocessed = cfg.paths.meteo_preprocessed_dir
-            if preprocessed.exists() and any(preprocessed.iterdir()):
-                inputs = "/inputs/preprocessed"
-                avail = f"{inputs}/AVAILABLE"
-            else:
-                inputs = "/inputs"
-                avail = "/inputs/AVAILABLE"
-        else:
-            inputs = "/inputs"
-            avail = "/inputs/AVAILABLE"
-
-        content = f"""/options/
-/output/
-{inputs}/
-{avail}
-"""
-        (cfg.paths.workspace / "pathnames").write_text(content)
-
-    def _write_command(self, cfg: RuntimeConfig) -> None:
-        sim = cfg.simulation
-        window = sim.window
-        duration = int((window.end - window.start).total_seconds())
-        loutrestart = max(86400, duration)
-        command = f"""&COMMAND
+# Namelist templates are assembled once at import time; the _write_* methods
+# only substitute the run-specific values.
+_COMMAND_TMPL = """&COMMAND
 LDIRECT=               1,
-IBDATE=         {window.start.strftime('%Y%m%d')},
-IBTIME=           {window.start.strftime('%H%M%S')},
-IEDATE=         {window.end.strftime('%Y%m%d')},
-IETIME=           {window.end.strftime('%H%M%S')},
-LOUTSTEP=           {sim.numerics.output_interval_sec},
-LOUTAVER=           {sim.numerics.output_interval_sec},
-LOUTSAMPLE=          {sim.numerics.sampling_interval_sec},
+IBDATE=         {ibdate},
+IBTIME=           {ibtime},
+IEDATE=         {iedate},
+IETIME=           {ietime},
+LOUTSTEP=           {loutstep},
+LOUTAVER=           {loutstep},
+LOUTSAMPLE=          {loutsample},
 LOUTRESTART=       {loutrestart},
-LRECOUTSTEP=        {sim.numerics.output_interval_sec},
-LRECOUTAVER=        {sim.numerics.output_interval_sec},
-LRECOUTSAMPLE=       {sim.numerics.sampling_interval_sec},
-LSYNCTIME=           {sim.numerics.sampling_interval_sec},
+LRECOUTSTEP=        {loutstep},
+LRECOUTAVER=        {loutstep},
+LRECOUTSAMPLE=       {loutsample},
+LSYNCTIME=           {loutsample},
 CTL=          -5.0000000,
 IFINE=                 4,
 IOUT=                  1,
 IPOUT=                 0,
 LSUBGRID=              0,
 LCONVECTION=           0,
-LTURBULENCE=           {sim.numerics.turbulence},
+LTURBULENCE=           {turbulence},
 LTURBULENCE_MESO=      0,
 LAGESPECTRA=           0,
 IPIN=                  0,
@@ -102,7 +47,7 @@ IND_SOURCE=            1,
 IND_RECEPTOR=          0,
 MQUASILAG=             0,
 NESTED_OUTPUT=         0,
-LNETCDFOUT=            {sim.numerics.netcdf_output},
+LNETCDFOUT=            {netcdf_output},
 LINIT_COND=            0,
 SFC_ONLY=              0,
 CBLFLAG=               0,
@@ -113,52 +58,39 @@ MAXFILESIZE=       10000,
 LOGVERTINTERP=         0,
 &END
 """
-        (cfg.paths.workspace / "COMMAND").write_text(command)
 
-    def _write_releases(self, cfg: RuntimeConfig) -> None:
-        sim = cfg.simulation
-        release = sim.release
-        window = sim.window
-        release_end = min(window.end, window.start + timedelta(hours=release.duration_hours))
-        num = sim.numerics.particles
-        content = f"""&RELEASES_CTRL
+_RELEASES_TMPL = """&RELEASES_CTRL
  NSPEC      =           1,
  SPECNUM_REL=           1,
  /
 &RELEASE
- IDATE1  =       {window.start.strftime('%Y%m%d')},
- ITIME1  =         {window.start.strftime('%H%M%S')},
- IDATE2  =       {release_end.strftime('%Y%m%d')},
- ITIME2  =         {release_end.strftime('%H%M%S')},
- LON1    =         {release.longitude:8.3f},
- LON2    =         {release.longitude:8.3f},
- LAT1    =         {release.latitude:8.3f},
- LAT2    =         {release.latitude:8.3f},
- Z1      =         {release.height_bottom_m:8.3f},
- Z2      =         {release.height_top_m:8.3f},
+ IDATE1  =       {idate1},
+ ITIME1  =         {itime1},
+ IDATE2  =       {idate2},
+ ITIME2  =         {itime2},
+ LON1    =         {lon:8.3f},
+ LON2    =         {lon:8.3f},
+ LAT1    =         {lat:8.3f},
+ LAT2    =         {lat:8.3f},
+ Z1      =         {z1:8.3f},
+ Z2      =         {z2:8.3f},
  ZKIND   =              1,
- MASS    =       {sim.release_mass_kg:10.4E},
- PARTS   =          {num:8d},
+ MASS    =       {mass:10.4E},
+ PARTS   =          {parts:8d},
  COMMENT =    "RELEASE 1",
  /
 """
-        (cfg.paths.workspace / "RELEASES").write_text(content)
 
-    def _write_species(self, cfg: RuntimeConfig) -> None:
-        species = cfg.simulation.species
-        content = f"""&SPECIES_PARAMS
- PSPECIES="{species.name}",
- PWEIGHTMOLAR={species.molecular_weight:.2f},
- PDECAY={species.half_life_days or -9.9},
+_SPECIES_TMPL = """&SPECIES_PARAMS
+ PSPECIES="{name}",
+ PWEIGHTMOLAR={weight:.2f},
+ PDECAY={decay},
  /
 """
-        (cfg.paths.species_dir / "SPECIES_001").write_text(content)
 
-    def _write_outgrid(self, cfg: RuntimeConfig) -> None:
-        release = cfg.simulation.release
-        content = f"""&OUTGRID
- OUTLON0=        {release.longitude - 5:.1f},
- OUTLAT0=        {release.latitude - 5:.1f},
+_OUTGRID_TMPL = """&OUTGRID
+ OUTLON0=        {outlon0:.1f},
+ OUTLAT0=        {outlat0:.1f},
  NUMXGRID=             60,
  NUMYGRID=             60,
  DXOUT=               0.2,
@@ -166,12 +98,181 @@ LOGVERTINTERP=         0,
  OUTHEIGHTS=   500.0, 1500.0, 5000.0, 50000.0,
  /
 """
-        (cfg.paths.workspace / "OUTGRID").write_text(content)
 
-    def _write_ageclasses(self, cfg: RuntimeConfig) -> None:
-        content = """&AGECLASSES
+_AGECLASSES_TMPL = """&AGECLASSES
 NCLASS=                 1,
 LAGE=                   0,
 &END
 """
-        (cfg.paths.workspace / "AGECLASSES").write_text(content)
+_AGECLASSES_BYTES = _AGECLASSES_TMPL.encode("ascii")
+
+
+class FlexpartInputBuilder:
+    """Generates COMMAND/RELEASES/etc. based on the runtime config."""
+
+    STATIC_FILES = ("IGBP_int1.dat", "sfcdata.t", "sfcdepo.t")
+
+    def prepare(self, cfg: RuntimeConfig) -> None:
+        workspace = cfg.paths.workspace
+        workspace.mkdir(parents=True, exist_ok=True)
+        cfg.paths.output_dir.mkdir(parents=True, exist_ok=True)
+        cfg.paths.species_dir.mkdir(parents=True, exist_ok=True)
+        self._extract_static_files(cfg)
+        # The control files are independent, so let the writes hit the kernel
+        # concurrently; this mostly matters on network filesystems. All
+        # directories are created above, before the pool starts.
+        writers = (
+            self._write_pathnames,
+            self._write_command,
+            self._write_releases,
+            self._write_species,
+            self._write_outgrid,
+            self._write_ageclasses,
+        )
+        with ThreadPoolExecutor(max_workers=len(writers)) as pool:
+            futures = [pool.submit(writer, cfg) for writer in writers]
+            for future in futures:
+                future.result()
+
+    def _extract_static_files(self, cfg: RuntimeConfig) -> None:
+        workspace = cfg.paths.workspace
+        if all((workspace / fname).exists() for fname in self.STATIC_FILES):
+            console.log("Static input files already present; skipping extraction")
+            return
+        cache_dir = self._static_cache_dir(cfg.flexpart_image)
+        if not all((cache_dir / fname).exists() for fname in self.STATIC_FILES):
+            self._extract_to_cache(cfg.flexpart_image, cache_dir)
+        for fname in self.STATIC_FILES:
+            target = workspace / fname
+            if target.exists():
+                continue
+            try:
+                os.link(cache_dir / fname, target)
+            except OSError:
+                shutil.copy2(cache_dir / fname, target)
+
+    def _static_cache_dir(self, image: str) -> Path:
+        # Keyed by image digest so a rebuilt image invalidates the cache.
+        result = subprocess.run(
+            ["docker", "image", "inspect", "--format", "{{.Id}}", image],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        digest = result.stdout.strip().replace(":", "_")
+        return Path.home() / ".cache" / "flexpart_app" / "static" / digest
+
+    def _extract_to_cache(self, image: str, cache_dir: Path) -> None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # A created (never started) container lets docker cp stream the files
+        # without paying a container cold-start per file.
+        container = f"flexpart-static-{os.getpid()}"
+        console.log(f"Extracting static files from {image}")
+        subprocess.run(
+            ["docker", "create", "--name", container, image],
+            check=True,
+            capture_output=True,
+        )
+        try:
+            for fname in self.STATIC_FILES:
+                subprocess.run(
+                    ["docker", "cp", f"{container}:/options/{fname}", str(cache_dir / fname)],
+                    check=True,
+                    capture_output=True,
+                )
+        finally:
+            subprocess.run(
+                ["docker", "rm", container], check=False, capture_output=True
+            )
+
+    def _write_pathnames(self, cfg: RuntimeConfig) -> None:
+        if cfg.simulation.use_era5:
+            preprocessed = cfg.paths.meteo_preprocessed_dir
+            if preprocessed.exists() and any(preprocessed.iterdir()):
+                inputs = "/inputs/preprocessed"
+                avail = f"{inputs}/AVAILABLE"
+            else:
+                inputs = "/inputs"
+                avail = "/inputs/AVAILABLE"
+        else:
+            inputs = "/inputs"
+            avail = "/inputs/AVAILABLE"
+
+        content = f"""/options/
+/output/
+{inputs}/
+{avail}
+"""
+        (cfg.paths.workspace / "pathnames").write_bytes(content.encode("ascii"))
+
+    def _write_command(self, cfg: RuntimeConfig) -> None:
+        sim = cfg.simulation
+        window = sim.window
+        duration = int((window.end - window.start).total_seconds())
+        ibdate = window.start.strftime("%Y%m%d")
+        ibtime = window.start.strftime("%H%M%S")
+        iedate = window.end.strftime("%Y%m%d")
+        ietime = window.end.strftime("%H%M%S")
+        command = _COMMAND_TMPL.format_map(
+            {
+                "ibdate": ibdate,
+                "ibtime": ibtime,
+                "iedate": iedate,
+                "ietime": ietime,
+                "loutstep": sim.numerics.output_interval_sec,
+                "loutsample": sim.numerics.sampling_interval_sec,
+                "loutrestart": max(86400, duration),
+                "turbulence": sim.numerics.turbulence,
+                "netcdf_output": sim.numerics.netcdf_output,
+            }
+        )
+        (cfg.paths.workspace / "COMMAND").write_bytes(command.encode("ascii"))
+
+    def _write_releases(self, cfg: RuntimeConfig) -> None:
+        sim = cfg.simulation
+        release = sim.release
+        window = sim.window
+        release_end = min(window.end, window.start + timedelta(hours=release.duration_hours))
+        idate1 = window.start.strftime("%Y%m%d")
+        itime1 = window.start.strftime("%H%M%S")
+        idate2 = release_end.strftime("%Y%m%d")
+        itime2 = release_end.strftime("%H%M%S")
+        content = _RELEASES_TMPL.format_map(
+            {
+                "idate1": idate1,
+                "itime1": itime1,
+                "idate2": idate2,
+                "itime2": itime2,
+                "lon": release.longitude,
+                "lat": release.latitude,
+                "z1": release.height_bottom_m,
+                "z2": release.height_top_m,
+                "mass": sim.release_mass_kg,
+                "parts": sim.numerics.particles,
+            }
+        )
+        (cfg.paths.workspace / "RELEASES").write_bytes(content.encode("ascii"))
+
+    def _write_species(self, cfg: RuntimeConfig) -> None:
+        species = cfg.simulation.species
+        content = _SPECIES_TMPL.format_map(
+            {
+                "name": species.name,
+                "weight": species.molecular_weight,
+                "decay": species.half_life_days or -9.9,
+            }
+        )
+        (cfg.paths.species_dir / "SPECIES_001").write_bytes(content.encode("ascii"))
+
+    def _write_outgrid(self, cfg: RuntimeConfig) -> None:
+        release = cfg.simulation.release
+        content = _OUTGRID_TMPL.format_map(
+            {
+                "outlon0": release.longitude - 5,
+                "outlat0": release.latitude - 5,
+            }
+        )
+        (cfg.paths.workspace / "OUTGRID").write_bytes(content.encode("ascii"))
+
+    def _write_ageclasses(self, cfg: RuntimeConfig) -> None:
+        (cfg.paths.workspace / "AGECLASSES").write_bytes(_AGECLASSES_BYTES)
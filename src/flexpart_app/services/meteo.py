@@ -1,15 +1,60 @@
 """Utilities for managing meteorological inputs."""
 from __future__ import annotations
 
+import os
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Iterable
+
+# Bound-method template for AVAILABLE rows; the constant padding and the
+# trailing "ON DISK" marker live in one literal instead of per-row pieces.
+_ROW = "{0} {1}      {2:<30}      ON DISK".format
 
 
 class MeteoError(RuntimeError):
     """Raised when meteorological products are missing or malformed."""
 
 
+@lru_cache(maxsize=8192)
+def _parse(suffix: str) -> datetime | None:
+    """Parse a product filename timestamp suffix, or None if unparseable."""
+    # All supported suffixes are plain digit runs, so the common path is a
+    # width dispatch with direct int slicing — no regex, no strptime, and no
+    # ValueError-driven format probing.
+    if suffix.isdigit():
+        n = len(suffix)
+        try:
+            if n == 10:
+                return datetime(
+                    int(suffix[:4]), int(suffix[4:6]), int(suffix[6:8]), int(suffix[8:10])
+                )
+            if n == 8:
+                return datetime(int(suffix[:4]), int(suffix[4:6]), int(suffix[6:8]))
+            if n == 12:
+                return datetime(
+                    int(suffix[:4]),
+                    int(suffix[4:6]),
+                    int(suffix[6:8]),
+                    int(suffix[8:10]),
+                    int(suffix[10:12]),
+                )
+            if n == 6:
+                year = int(suffix[:2])
+                year += 2000 if year < 69 else 1900
+                return datetime(year, int(suffix[2:4]), int(suffix[4:6]))
+        except ValueError:
+            pass  # e.g. month 13; let strptime probe the 2-digit-year layouts
+    # strptime's %y applies the same 00-68 -> 20xx / 69-99 -> 19xx window as
+    # the fast path above, so no further century adjustment is needed.
+    for fmt in ("%Y%m%d%H", "%Y%m%d", "%Y%m%d%H%M", "%y%m%d%H", "%y%m%d", "%y%m%d%H%M"):
+        try:
+            return datetime.strptime(suffix, fmt)
+        except ValueError:
+            continue
+    return None
+
+
 def create_available_file(
     product_dir: Path,
     start_time: datetime,
@@ -17,47 +62,32 @@ def create_available_file(
     prefix: str = "EC",
 ) -> int:
     """Generate a FLEXPART AVAILABLE file from EC* GRIB products."""
-    products = sorted(product_dir.glob(f"{prefix}*"))
-    if not products:
+    # scandir exposes file-vs-directory from the readdir data itself, so no
+    # per-entry stat calls are needed (they add up on bind mounts and NFS).
+    with os.scandir(product_dir) as it:
+        entries = [
+            e.name
+            for e in it
+            if e.name.startswith(prefix) and e.is_file(follow_symlinks=False)
+        ]
+    if not entries:
         raise MeteoError(f"No {prefix} files found in {product_dir}")
 
-    def _parse(name: str) -> datetime | None:
-        suffix = name[len(prefix) :]
-        for fmt in ("%Y%m%d%H", "%Y%m%d", "%Y%m%d%H%M"):
-            try:
-                return datetime.strptime(suffix, fmt)
-            except ValueError:
-                continue
-        for fmt in ("%y%m%d%H", "%y%m%d", "%y%m%d%H%M"):
-            try:
-                ts = datetime.strptime(suffix, fmt)
-                if ts.year < 1950:
-                    ts = ts.replace(year=ts.year + 2000)
-                elif ts.year < 2000:
-                    ts = ts.replace(year=ts.year + 1900)
-                return ts
-            except ValueError:
-                continue
-        return None
-
+    all_parsed: list[tuple[datetime, str]] = []
     filtered: list[tuple[datetime, str]] = []
     unparseable: list[str] = []
-    for item in products:
-        if not item.is_file():
-            continue
-        ts = _parse(item.name)
+    for name in entries:
+        ts = _parse(name[len(prefix) :])
         if ts is None:
-            unparseable.append(item.name)
+            unparseable.append(name)
             continue
+        all_parsed.append((ts, name))
         if start_time <= ts <= end_time:
-            filtered.append((ts, item.name))
+            filtered.append((ts, name))
 
     if not filtered:
-        for item in products:
-            ts = _parse(item.name)
-            if ts is not None:
-                filtered.append((ts, item.name))
-        filtered.sort(key=lambda row: row[0])
+        # Window excluded everything: fall back to all parseable products.
+        filtered = all_parsed
 
     if not filtered:
         raise MeteoError(
@@ -65,15 +95,30 @@ def create_available_file(
             + ", ".join(unparseable)
         )
 
+    # Sort only the rows that survive filtering, by parsed timestamp (name
+    # order would interleave mixed 2- and 4-digit-year suffixes).
+    filtered.sort(key=itemgetter(0, 1))
+
     header = [
         "XXXXXX EMPTY LINES XXXXXXXXX",
         "XXXXXX EMPTY LINES XXXXXXXX",
         "YYYYMMDD HHMMSS   name of the file(up to 80 characters)",
     ]
-    entries: Iterable[str] = (
-        f"{ts.strftime('%Y%m%d')} {ts.strftime('%H%M%S')}      {name:<30}      ON DISK"
+    # Pure integer formatting: two strftime calls per row add up over large
+    # product directories.
+    rows = [
+        _ROW(
+            f"{ts.year:04d}{ts.month:02d}{ts.day:02d}",
+            f"{ts.hour:02d}{ts.minute:02d}{ts.second:02d}",
+            name,
+        )
         for ts, name in filtered
-    )
-    (product_dir / "AVAILABLE").write_text("\n".join([*header, *entries]) + "\n")
+    ]
+    # Stream rows through a buffered writer rather than assembling the whole
+    # file in one string; keeps peak memory flat for very large directories.
+    with (product_dir / "AVAILABLE").open("w", buffering=1 << 20) as handle:
+        handle.write("\n".join(header))
+        handle.write("\n")
+        handle.writelines(row + "\n" for row in rows)
     return len(filtered)
 
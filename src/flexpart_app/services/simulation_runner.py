@@ -16,12 +16,17 @@ class FlexpartSimulationRunner:
 
     def __init__(self, docker: DockerRunner) -> None:
         self._docker = docker
+        # Image tags verified present in this process; batch dispatch would
+        # otherwise pay a docker images fork+exec per simulation.
+        self._images_seen: set[str] = set()
 
     def run(self, cfg: RuntimeConfig) -> Path:
-        if not self._docker.images(cfg.flexpart_image):
-            raise DockerError(
-                f"Docker image {cfg.flexpart_image} missing. Build Dockerfile.arm64 first."
-            )
+        if cfg.flexpart_image not in self._images_seen:
+            if not self._docker.images(cfg.flexpart_image):
+                raise DockerError(
+                    f"Docker image {cfg.flexpart_image} missing. Build Dockerfile.arm64 first."
+                )
+            self._images_seen.add(cfg.flexpart_image)
 
         workspace = cfg.paths.workspace
         output_dir = cfg.paths.output_dir
@@ -43,6 +48,11 @@ class FlexpartSimulationRunner:
         ]
 
         console.log("Running FLEXPART container...")
-        self._docker.run([cfg.flexpart_image], volumes=volumes)
+        try:
+            self._docker.run([cfg.flexpart_image], volumes=volumes)
+        except DockerError:
+            # The failure may mean the image disappeared; re-probe next time.
+            self._images_seen.discard(cfg.flexpart_image)
+            raise
         return output_dir
 